@@ -3,6 +3,9 @@ from abc import abstractmethod
 
 
 class _MlflowObject:
+    # Declare empty slots so that subclasses can opt into __slots__
+    __slots__ = ()
+
     def __iter__(self):
         # Iterate through list of properties and yield as key -> value
         for prop in self._properties():
@@ -1,9 +1,49 @@
-from typing import Any, Optional
+import json
+import operator
+import sys
+from itertools import zip_longest
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
 
 from mlflow.entities._mlflow_object import _MlflowObject
 from mlflow.entities.assessment import Assessment
 from mlflow.entities.evaluation_tag import EvaluationTag  # Assuming EvaluationTag is in this module
 from mlflow.entities.metric import Metric
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+# Applied with map() so that nested entities are serialized without a Python-level loop
+_to_dictionary = operator.methodcaller("to_dictionary")
+
+# Field order of the tuple representation produced by `Evaluation.to_tuple()`
+_FIELDS = (
+    "evaluation_id",
+    "run_id",
+    "inputs_id",
+    "inputs",
+    "outputs",
+    "request_id",
+    "targets",
+    "error_code",
+    "error_message",
+    "assessments",
+    "metrics",
+    "tags",
+)
+
+# Evaluation-level fields included by `Evaluation.to_columnar()`, i.e. all fields except the
+# lists of nested entities
+_COLUMNAR_FIELDS = _FIELDS[: _FIELDS.index("assessments")]
+_get_columnar_fields = operator.attrgetter(*(f"_{field}" for field in _COLUMNAR_FIELDS))
+
+# Optional fields that `Evaluation.to_dictionary()` omits when they are None
+_OPTIONAL_FIELDS = _COLUMNAR_FIELDS[_COLUMNAR_FIELDS.index("outputs") :]
+_get_optional_fields = operator.attrgetter(*(f"_{field}" for field in _OPTIONAL_FIELDS))
+
+
+def _intern(value):
+    # sys.intern() only accepts exact str instances
+    return sys.intern(value) if type(value) is str else value
 
 
 class Evaluation(_MlflowObject):
@@ -11,6 +51,12 @@ class Evaluation(_MlflowObject):
     Evaluation result data, including inputs, outputs, targets, assessments, and more.
     """
 
+    # NB: Evaluations are created in bulk when logging or loading evaluation results, so use
+    # slots to avoid allocating a per-instance __dict__
+    __slots__ = (*(f"_{field}" for field in _FIELDS), "_cached_view")
+
+    _FIELDS = _FIELDS
+
     def __init__(
         self,
         evaluation_id: str,
@@ -46,8 +92,10 @@ class Evaluation(_MlflowObject):
             tags: List of tags associated with the evaluation.
         """
         self._evaluation_id = evaluation_id
-        self._run_id = run_id
-        self._inputs_id = inputs_id
+        # NB: Evaluations that are logged or loaded together typically share the same run ID, and
+        # often the same inputs ID, so intern them to store a single copy of each ID
+        self._run_id = _intern(run_id)
+        self._inputs_id = _intern(inputs_id)
         self._inputs = inputs
         self._outputs = outputs
         self._request_id = request_id
@@ -57,6 +105,7 @@ class Evaluation(_MlflowObject):
         self._assessments = assessments
         self._metrics = metrics
         self._tags = tags
+        self._cached_view = None
 
     @property
     def evaluation_id(self) -> str:
@@ -118,6 +167,16 @@ class Evaluation(_MlflowObject):
         """The evaluation tags."""
         return self._tags
 
+    def __getstate__(self):
+        # NB: The cached view can't be pickled, so leave it out and rebuild it on demand
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        state["_cached_view"] = None
+        return state
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
     def __eq__(self, __o):
         if isinstance(__o, self.__class__):
             return self.to_dictionary() == __o.to_dictionary()
@@ -130,25 +189,164 @@ class Evaluation(_MlflowObject):
         Returns:
             dict: The Evaluation object represented as a dictionary.
         """
+        # NB: Read the slots directly rather than going through the property descriptors, since
+        # this is called for every evaluation that is logged
         evaluation_dict = {
-            "evaluation_id": self.evaluation_id,
-            "run_id": self.run_id,
-            "inputs_id": self.inputs_id,
-            "inputs": self.inputs,
-            "outputs": self.outputs,
-            "request_id": self.request_id,
-            "targets": self.targets,
-            "error_code": self.error_code,
-            "error_message": self.error_message,
-            "assessments": [assess.to_dictionary() for assess in self.assessments]
-            if self.assessments
-            else None,
-            "metrics": [metric.to_dictionary() for metric in self.metrics]
-            if self.metrics
-            else None,
-            "tags": [tag.to_dictionary() for tag in self.tags] if self.tags else None,
+            "evaluation_id": self._evaluation_id,
+            "run_id": self._run_id,
+            "inputs_id": self._inputs_id,
+            "inputs": self._inputs,
+        }
+        # Only add the optional fields that are set, rather than building a dictionary with
+        # every field and filtering out the None values afterwards
+        for key, value in zip(_OPTIONAL_FIELDS, _get_optional_fields(self)):
+            if value is not None:
+                evaluation_dict[key] = value
+        # NB: Empty lists are omitted just like None. Evaluations are stored as tables, where an
+        # evaluation without assessments, metrics, or tags can't be told apart from one with an
+        # empty list, so omitting them keeps the dictionary stable across a round trip
+        if self._assessments:
+            evaluation_dict["assessments"] = list(map(_to_dictionary, self._assessments))
+        if self._metrics:
+            evaluation_dict["metrics"] = list(map(_to_dictionary, self._metrics))
+        if self._tags:
+            evaluation_dict["tags"] = list(map(_to_dictionary, self._tags))
+        return evaluation_dict
+
+    def to_dictionary_view(self) -> Mapping[str, Any]:
+        """
+        Get a read-only view of the dictionary returned by :py:meth:`to_dictionary`.
+
+        Evaluation objects are not modified after construction, so the view is built on the first
+        call and shared by all later callers, which avoids serializing the evaluation again for
+        consumers that only read it. Nested values such as the lists of assessments, metrics, and
+        tags are not protected by the view and must not be mutated.
+
+        Returns:
+            Mapping: The Evaluation object represented as a read-only dictionary.
+        """
+        if self._cached_view is None:
+            self._cached_view = MappingProxyType(self.to_dictionary())
+        return self._cached_view
+
+    def to_mutable_dictionary(self) -> dict[str, Any]:
+        """
+        Convert the Evaluation object to a dictionary that can be modified by the caller.
+
+        Returns:
+            dict: The Evaluation object represented as a dictionary.
+        """
+        return self.to_dictionary()
+
+    def to_tuple(self) -> tuple[Any, ...]:
+        """
+        Convert the Evaluation object to a tuple with the fields in the order of ``_FIELDS``.
+
+        This is a more compact alternative to :py:meth:`to_dictionary` for internal transport.
+        Assessments, metrics, and tags are represented as lists of dictionaries, and unset fields
+        are represented as None.
+
+        Returns:
+            tuple: The Evaluation object represented as a tuple.
+        """
+        return (
+            self._evaluation_id,
+            self._run_id,
+            self._inputs_id,
+            self._inputs,
+            self._outputs,
+            self._request_id,
+            self._targets,
+            self._error_code,
+            self._error_message,
+            None if self._assessments is None else list(map(_to_dictionary, self._assessments)),
+            None if self._metrics is None else list(map(_to_dictionary, self._metrics)),
+            None if self._tags is None else list(map(_to_dictionary, self._tags)),
+        )
+
+    @classmethod
+    def from_tuple(cls, evaluation_tuple: tuple[Any, ...]):
+        """
+        Create an Evaluation object from a tuple produced by :py:meth:`to_tuple`.
+
+        Args:
+            evaluation_tuple (tuple): Tuple containing evaluation information.
+
+        Returns:
+            Evaluation: The Evaluation object created from the tuple.
+        """
+        if len(evaluation_tuple) != len(cls._FIELDS):
+            raise MlflowException(
+                f"Expected an evaluation tuple with {len(cls._FIELDS)} fields {cls._FIELDS}, "
+                f"but got {len(evaluation_tuple)} fields",
+                INVALID_PARAMETER_VALUE,
+            )
+
+        (
+            evaluation_id,
+            run_id,
+            inputs_id,
+            inputs,
+            outputs,
+            request_id,
+            targets,
+            error_code,
+            error_message,
+            assessments,
+            metrics,
+            tags,
+        ) = evaluation_tuple
+        return cls(
+            evaluation_id=evaluation_id,
+            run_id=run_id,
+            inputs_id=inputs_id,
+            inputs=inputs,
+            outputs=outputs,
+            request_id=request_id,
+            targets=targets,
+            error_code=error_code,
+            error_message=error_message,
+            assessments=None
+            if assessments is None
+            else list(map(Assessment.from_dictionary, assessments)),
+            metrics=None if metrics is None else list(map(Metric.from_dictionary, metrics)),
+            tags=None if tags is None else list(map(EvaluationTag.from_dictionary, tags)),
+        )
+
+    @classmethod
+    def to_columnar(cls, evaluations: list["Evaluation"]) -> dict[str, list[Any]]:
+        """
+        Convert a batch of Evaluation objects to a columnar representation, e.g. for constructing
+        a pandas DataFrame or a pyarrow Table without creating a dictionary per evaluation.
+
+        Only the evaluation-level fields are included. Assessments, metrics, and tags have a
+        variable number of entries per evaluation and are excluded.
+
+        Args:
+            evaluations (List[Evaluation]): Evaluation objects to convert.
+
+        Returns:
+            dict: A mapping from field name to a list with the value of that field for each
+            evaluation, in order. Fields that are not set are represented as None.
+        """
+        columns = zip(*map(_get_columnar_fields, evaluations))
+        return {
+            field: list(column)
+            for field, column in zip_longest(_COLUMNAR_FIELDS, columns, fillvalue=())
         }
-        return {k: v for k, v in evaluation_dict.items() if v is not None}
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the Evaluation object to compact, UTF-8 encoded JSON.
+
+        Returns:
+            bytes: The Evaluation object represented as JSON.
+        """
+        from mlflow.tracing.utils import TraceJSONEncoder
+
+        return json.dumps(
+            self.to_dictionary(), cls=TraceJSONEncoder, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
 
     @classmethod
     def from_dictionary(cls, evaluation_dict: dict[str, Any]):
@@ -161,27 +359,69 @@ class Evaluation(_MlflowObject):
         Returns:
             Evaluation: The Evaluation object created from the dictionary.
         """
+        return cls._from_dictionary(
+            evaluation_dict,
+            Assessment.from_dictionary,
+            Metric.from_dictionary,
+            EvaluationTag.from_dictionary,
+        )
+
+    @classmethod
+    def from_dictionaries(cls, evaluation_dicts: list[dict[str, Any]]) -> list["Evaluation"]:
+        """
+        Create Evaluation objects from a list of dictionaries.
+
+        This is equivalent to calling :py:meth:`from_dictionary` on each dictionary, but looks up
+        the parsers of the nested entities once per batch rather than once per evaluation.
+
+        Args:
+            evaluation_dicts (List[dict]): Dictionaries containing evaluation information.
+
+        Returns:
+            List[Evaluation]: The Evaluation objects created from the dictionaries.
+        """
+        from_dictionary = cls._from_dictionary
+        assessment_from_dictionary = Assessment.from_dictionary
+        metric_from_dictionary = Metric.from_dictionary
+        tag_from_dictionary = EvaluationTag.from_dictionary
+        return [
+            from_dictionary(
+                evaluation_dict,
+                assessment_from_dictionary,
+                metric_from_dictionary,
+                tag_from_dictionary,
+            )
+            for evaluation_dict in evaluation_dicts
+        ]
+
+    @classmethod
+    def _from_dictionary(
+        cls,
+        evaluation_dict: dict[str, Any],
+        assessment_from_dictionary: Callable[[dict[str, Any]], Assessment],
+        metric_from_dictionary: Callable[[dict[str, Any]], Metric],
+        tag_from_dictionary: Callable[[dict[str, Any]], EvaluationTag],
+    ) -> "Evaluation":
         assessments = None
         if "assessments" in evaluation_dict:
-            assessments = [
-                Assessment.from_dictionary(assess) for assess in evaluation_dict["assessments"]
-            ]
+            assessments = list(map(assessment_from_dictionary, evaluation_dict["assessments"]))
         metrics = None
         if "metrics" in evaluation_dict:
-            metrics = [Metric.from_dictionary(metric) for metric in evaluation_dict["metrics"]]
+            metrics = list(map(metric_from_dictionary, evaluation_dict["metrics"]))
         tags = None
         if "tags" in evaluation_dict:
-            tags = [EvaluationTag(tag["key"], tag["value"]) for tag in evaluation_dict["tags"]]
+            tags = list(map(tag_from_dictionary, evaluation_dict["tags"]))
+        get = evaluation_dict.get
         return cls(
             evaluation_id=evaluation_dict["evaluation_id"],
             run_id=evaluation_dict["run_id"],
             inputs_id=evaluation_dict["inputs_id"],
             inputs=evaluation_dict["inputs"],
-            outputs=evaluation_dict.get("outputs"),
-            request_id=evaluation_dict.get("request_id"),
-            targets=evaluation_dict.get("targets"),
-            error_code=evaluation_dict.get("error_code"),
-            error_message=evaluation_dict.get("error_message"),
+            outputs=get("outputs"),
+            request_id=get("request_id"),
+            targets=get("targets"),
+            error_code=get("error_code"),
+            error_message=get("error_message"),
             assessments=assessments,
             metrics=metrics,
             tags=tags,
@@ -4,6 +4,9 @@ from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 from mlflow.protos.service_pb2 import Metric as ProtoMetric
 from mlflow.protos.service_pb2 import MetricWithRunId as ProtoMetricWithRunId
 
+_REQUIRED_DICTIONARY_KEYS = ("key", "value", "timestamp", "step")
+_REQUIRED_DICTIONARY_KEY_SET = frozenset(_REQUIRED_DICTIONARY_KEYS)
+
 
 class Metric(_MlflowObject):
     """
@@ -82,9 +85,10 @@ class Metric(_MlflowObject):
         Returns:
             Metric: The Metric object created from the dictionary.
         """
-        required_keys = ["key", "value", "timestamp", "step"]
-        missing_keys = [key for key in required_keys if key not in metric_dict]
-        if missing_keys:
+        # NB: Check the keys with a single set comparison, and only work out which keys are
+        # missing when raising the error, since this is called for every metric that is loaded
+        if not metric_dict.keys() >= _REQUIRED_DICTIONARY_KEY_SET:
+            missing_keys = [key for key in _REQUIRED_DICTIONARY_KEYS if key not in metric_dict]
             raise MlflowException(
                 f"Missing required keys {missing_keys} in metric dictionary",
                 INVALID_PARAMETER_VALUE,
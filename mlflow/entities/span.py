@@ -1,7 +1,7 @@
 import json
 import logging
 from dataclasses import asdict
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Any, Optional, Union
 
 from opentelemetry.sdk.trace import Event as OTelEvent
@@ -92,8 +92,9 @@ class Span:
         # deserialization of the attribute values.
         self._attributes = _CachedSpanAttributesRegistry(otel_span)
 
-    @property
-    @lru_cache(maxsize=1)
+    # NB: The IDs of a span don't change after it is created, so they are cached on the instance
+    #     to avoid decoding the attribute value or formatting the hex string on every access.
+    @cached_property
     def request_id(self) -> str:
         """
         The request ID of the span, a unique identifier for the trace it belongs to.
@@ -102,7 +103,7 @@ class Span:
         """
         return self.get_attribute(SpanAttributeKey.REQUEST_ID)
 
-    @property
+    @cached_property
     def span_id(self) -> str:
         """The ID of the span. This is only unique within a trace."""
         return encode_span_id(self._span.context.span_id)
@@ -122,7 +123,7 @@ class Span:
         """The end time of the span in nanosecond."""
         return self._span._end_time
 
-    @property
+    @cached_property
     def parent_id(self) -> Optional[str]:
         """The span ID of the parent span."""
         if self._span.parent is None:
@@ -149,7 +150,7 @@ class Span:
         """The type of the span."""
         return self.get_attribute(SpanAttributeKey.SPAN_TYPE)
 
-    @property
+    @cached_property
     def _trace_id(self) -> str:
         """
         The OpenTelemetry trace ID of the span. Note that this should not be exposed to
@@ -300,6 +301,13 @@ class LiveSpan(Span):
         self._attributes.set(SpanAttributeKey.REQUEST_ID, request_id)
         self._attributes.set(SpanAttributeKey.SPAN_TYPE, span_type)
 
+    # NB: Unlike immutable spans, the IDs of a live span are not cached, because its attributes
+    #     can be updated and its context can be replaced after creation (see `_from_span`).
+    request_id = property(Span.request_id.func)
+    span_id = property(Span.span_id.func)
+    parent_id = property(Span.parent_id.func)
+    _trace_id = property(Span._trace_id.func)
+
     def set_inputs(self, inputs: Any):
         """Set the input values to the span."""
         self.set_attribute(SpanAttributeKey.INPUTS, inputs)
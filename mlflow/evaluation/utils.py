@@ -18,40 +18,41 @@ def evaluations_to_dataframes(
         Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]: A tuple of four DataFrames
         containing evaluation data, metrics data, assessments data, and tags data.
     """
-    evaluations_data = []
     metrics_data = []
     assessments_data = []
     tags_data = []
 
+    # NB: Read the nested entities from the evaluations directly rather than serializing each
+    # evaluation to a dictionary first
     for evaluation in evaluations:
-        eval_dict = evaluation.to_dictionary()
-
-        # Extract assessment and metrics
-        assessments_list = eval_dict.pop("assessments", [])
-        metrics_list = eval_dict.pop("metrics", [])
-        tags_list = eval_dict.pop("tags", [])
-
-        evaluations_data.append(eval_dict)
-
-        for metric_dict in metrics_list:
-            metric_dict["evaluation_id"] = eval_dict["evaluation_id"]
-            # Remove 'step' key if it exists, since it is not valid for evaluation metrics
-            metric_dict.pop("step", None)
-            metrics_data.append(metric_dict)
-
-        for assess_dict in assessments_list:
-            assess_dict["evaluation_id"] = eval_dict["evaluation_id"]
+        evaluation_id = evaluation.evaluation_id
+
+        for metric in evaluation.metrics or ():
+            # Leave out 'step', since it is not valid for evaluation metrics
+            metrics_data.append(
+                {
+                    "key": metric.key,
+                    "value": metric.value,
+                    "timestamp": metric.timestamp,
+                    "evaluation_id": evaluation_id,
+                }
+            )
+
+        for assessment in evaluation.assessments or ():
+            assess_dict = assessment.to_dictionary()
+            assess_dict["evaluation_id"] = evaluation_id
             assessments_data.append(assess_dict)
 
-        for tag_dict in tags_list:
-            tag_dict["evaluation_id"] = eval_dict["evaluation_id"]
-            tags_data.append(tag_dict)
+        for tag in evaluation.tags or ():
+            tags_data.append({"key": tag.key, "value": tag.value, "evaluation_id": evaluation_id})
 
+    # Build the main evaluation data column by column rather than from one dictionary per row
     evaluations_df = (
         _apply_schema_to_dataframe(
-            pd.DataFrame(evaluations_data), _get_evaluations_dataframe_schema()
+            pd.DataFrame(EvaluationEntity.to_columnar(evaluations)),
+            _get_evaluations_dataframe_schema(),
         )
-        if evaluations_data
+        if evaluations
         else _get_empty_evaluations_dataframe()
     )
     metrics_df = (
@@ -7,8 +7,10 @@ import logging
 import uuid
 from collections import Counter
 from dataclasses import asdict, is_dataclass
+from datetime import datetime
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
+from weakref import WeakKeyDictionary
 
 from opentelemetry import trace as trace_api
 from packaging.version import Version
@@ -46,70 +48,117 @@ class TraceJSONEncoder(json.JSONEncoder):
     """
 
     def default(self, obj):
+        # Fast path for datetimes, which are common in span attributes. This produces the same
+        # result as the str() fallback below without raising and catching a TypeError.
+        if obj.__class__ is datetime:
+            return str(obj)
+
+        serializer = _get_json_serializer(type(obj))
+        if serializer is not None:
+            return serializer(obj)
+
         try:
-            import langchain
+            return super().default(obj)
+        except TypeError:
+            return str(obj)
 
-            # LangChain < 0.3.0 does some trick to support Pydantic 1.x and 2.x, so checking
-            # type with installed Pydantic version might not work for some models.
-            # https://github.com/langchain-ai/langchain/blob/b66a4f48fa5656871c3e849f7e1790dfb5a4c56b/libs/core/langchain_core/pydantic_v1/__init__.py#L7
-            if Version(langchain.__version__) < Version("0.3.0"):
-                from langchain_core.pydantic_v1 import BaseModel as LangChainBaseModel
 
-                if isinstance(obj, LangChainBaseModel):
-                    return obj.dict()
-        except ImportError:
-            pass
+# Serializers resolved by _get_json_serializer, keyed by type. The keys are weak references so
+# that the cache doesn't keep classes created at runtime (e.g. Pydantic models defined inside a
+# function) alive. Accordingly, the cached serializers must not reference the type itself.
+_JSON_SERIALIZER_CACHE: WeakKeyDictionary[type, Optional[Callable[[Any], Any]]] = (
+    WeakKeyDictionary()
+)
 
-        try:
-            import pydantic
-
-            if isinstance(obj, pydantic.BaseModel):
-                # NB: Pydantic 2.0+ has a different API for model serialization
-                if Version(pydantic.VERSION) >= Version("2.0"):
-                    return obj.model_dump()
-                else:
-                    return obj.dict()
-        except ImportError:
-            pass
-
-        # Some dataclass object defines __str__ method that doesn't return the full object
-        # representation, so we use dict representation instead.
-        # E.g. https://github.com/run-llama/llama_index/blob/29ece9b058f6b9a1cf29bc723ed4aa3a39879ad5/llama-index-core/llama_index/core/chat_engine/types.py#L63-L64
-        if is_dataclass(obj):
+
+def _get_json_serializer(obj_type: type) -> Optional[Callable[[Any], Any]]:
+    """
+    Get the custom serialization logic of TraceJSONEncoder for the given type.
+
+    The logic only depends on the type of the object, so it is resolved once per type rather than
+    repeating the imports, version checks, and isinstance checks for every serialized object.
+
+    Returns:
+        A function that converts an instance of the type into a JSON-serializable value, or None
+        if the default serialization logic should be used.
+    """
+    try:
+        return _JSON_SERIALIZER_CACHE[obj_type]
+    except KeyError:
+        serializer = _resolve_json_serializer(obj_type)
+        _JSON_SERIALIZER_CACHE[obj_type] = serializer
+        return serializer
+
+
+def _resolve_json_serializer(obj_type: type) -> Optional[Callable[[Any], Any]]:
+    try:
+        import langchain
+
+        # LangChain < 0.3.0 does some trick to support Pydantic 1.x and 2.x, so checking
+        # type with installed Pydantic version might not work for some models.
+        # https://github.com/langchain-ai/langchain/blob/b66a4f48fa5656871c3e849f7e1790dfb5a4c56b/libs/core/langchain_core/pydantic_v1/__init__.py#L7
+        if Version(langchain.__version__) < Version("0.3.0"):
+            from langchain_core.pydantic_v1 import BaseModel as LangChainBaseModel
+
+            if issubclass(obj_type, LangChainBaseModel):
+                return obj_type.dict
+    except ImportError:
+        pass
+
+    try:
+        import pydantic
+
+        if issubclass(obj_type, pydantic.BaseModel):
+            # NB: Pydantic 2.0+ has a different API for model serialization
+            if Version(pydantic.VERSION) >= Version("2.0"):
+                return obj_type.model_dump
+            else:
+                return obj_type.dict
+    except ImportError:
+        pass
+
+    is_safe_to_encode_str = _is_safe_to_encode_str(obj_type)
+
+    # Some dataclass object defines __str__ method that doesn't return the full object
+    # representation, so we use dict representation instead.
+    # E.g. https://github.com/run-llama/llama_index/blob/29ece9b058f6b9a1cf29bc723ed4aa3a39879ad5/llama-index-core/llama_index/core/chat_engine/types.py#L63-L64
+    if is_dataclass(obj_type):
+
+        def _serialize_dataclass(obj):
             try:
                 return asdict(obj)
             except TypeError:
-                pass
+                return str(obj) if is_safe_to_encode_str else type(obj)
 
-        # Some object has dangerous side effect in __str__ method, so we use class name instead.
-        if not self._is_safe_to_encode_str(obj):
-            return type(obj)
+        return _serialize_dataclass
 
-        try:
-            return super().default(obj)
-        except TypeError:
-            return str(obj)
+    # Some object has dangerous side effect in __str__ method, so we use class name instead.
+    if not is_safe_to_encode_str:
+        return type
 
-    def _is_safe_to_encode_str(self, obj) -> bool:
-        """Check if it's safe to encode the object as a string."""
-        try:
-            # These Llama Index objects are not safe to encode as string, because their __str__
-            # method consumes the stream and make it unusable.
-            # E.g. https://github.com/run-llama/llama_index/blob/54f2da61ba8a573284ab8336f2b2810d948c3877/llama-index-core/llama_index/core/base/response/schema.py#L120-L127
-            from llama_index.core.base.response.schema import (
-                AsyncStreamingResponse,
-                StreamingResponse,
-            )
-            from llama_index.core.chat_engine.types import StreamingAgentChatResponse
-
-            if isinstance(
-                obj, (AsyncStreamingResponse, StreamingResponse, StreamingAgentChatResponse)
-            ):
-                return False
-        except ImportError:
-            pass
-
-        return True
+    return None
+
+
+def _is_safe_to_encode_str(obj_type: type) -> bool:
+    """Check if it's safe to encode instances of the given type as a string."""
+    try:
+        # These Llama Index objects are not safe to encode as string, because their __str__
+        # method consumes the stream and make it unusable.
+        # E.g. https://github.com/run-llama/llama_index/blob/54f2da61ba8a573284ab8336f2b2810d948c3877/llama-index-core/llama_index/core/base/response/schema.py#L120-L127
+        from llama_index.core.base.response.schema import (
+            AsyncStreamingResponse,
+            StreamingResponse,
+        )
+        from llama_index.core.chat_engine.types import StreamingAgentChatResponse
+
+        if issubclass(
+            obj_type, (AsyncStreamingResponse, StreamingResponse, StreamingAgentChatResponse)
+        ):
+            return False
+    except ImportError:
+        pass
+
+    return True
 
 
 @lru_cache(maxsize=1)
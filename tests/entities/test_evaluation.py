@@ -1,8 +1,20 @@
+import copy
+import json
+import math
+import pickle
+from collections import namedtuple
+from datetime import datetime
+from enum import Enum
+
+import pytest
+
 from mlflow.entities import Metric
 from mlflow.entities.assessment import Assessment
 from mlflow.entities.assessment_source import AssessmentSource
 from mlflow.entities.evaluation import Evaluation
 from mlflow.entities.evaluation_tag import EvaluationTag
+from mlflow.exceptions import MlflowException
+from mlflow.tracing.utils import TraceJSONEncoder
 
 
 def test_evaluation_equality():
@@ -183,3 +195,282 @@ def test_evaluation_construction_with_minimal_required_fields():
     evaluation_dict = evaluation.to_dictionary()
     recreated_evaluation = Evaluation.from_dictionary(evaluation_dict)
     assert recreated_evaluation == evaluation
+
+
+def test_evaluation_to_dictionary_returns_new_dictionary():
+    metric = Metric(key="metric1", value=1.1, timestamp=123, step=0)
+    evaluation = Evaluation(
+        evaluation_id="eval1",
+        run_id="run1",
+        inputs_id="inputs1",
+        inputs={"feature1": 1.0, "feature2": 2.0},
+        metrics=[metric],
+    )
+    other = Evaluation(
+        evaluation_id="eval1",
+        run_id="run1",
+        inputs_id="inputs1",
+        inputs={"feature1": 1.0, "feature2": 2.0},
+    )
+    evaluation.to_dictionary()["metrics"].append(metric.to_dictionary())
+    evaluation.to_dictionary().pop("metrics")
+
+    assert evaluation.to_dictionary()["metrics"] == [metric.to_dictionary()]
+    assert evaluation != other
+
+
+def test_evaluation_to_dictionary_view_is_read_only():
+    evaluation = Evaluation(
+        evaluation_id="eval1",
+        run_id="run1",
+        inputs_id="inputs1",
+        inputs={"feature1": 1.0},
+    )
+    assert type(evaluation.to_dictionary()) is dict
+    assert evaluation.to_dictionary_view() == evaluation.to_dictionary()
+    assert evaluation.to_dictionary_view() is evaluation.to_dictionary_view()
+    with pytest.raises(TypeError, match="does not support item assignment"):
+        evaluation.to_dictionary_view()["run_id"] = "run2"
+
+    mutable_dict = evaluation.to_mutable_dictionary()
+    assert type(mutable_dict) is dict
+    mutable_dict["run_id"] = "run2"
+    assert evaluation.to_dictionary()["run_id"] == "run1"
+
+
+def test_evaluation_uses_slots():
+    evaluation = Evaluation(
+        evaluation_id="eval1",
+        run_id="run1",
+        inputs_id="inputs1",
+        inputs={"feature1": 1.0, "feature2": 2.0},
+    )
+    assert not hasattr(evaluation, "__dict__")
+    assert pickle.loads(pickle.dumps(evaluation)) == evaluation
+
+
+def test_evaluation_can_be_pickled_and_copied_after_serialization():
+    evaluation = Evaluation(
+        evaluation_id="eval1",
+        run_id="run1",
+        inputs_id="inputs1",
+        inputs={"feature1": 1.0},
+        metrics=[Metric(key="metric1", value=1.1, timestamp=123, step=0)],
+    )
+    evaluation.to_dictionary()
+    evaluation.to_dictionary_view()
+
+    for restored in [pickle.loads(pickle.dumps(evaluation)), copy.deepcopy(evaluation)]:
+        assert restored == evaluation
+        assert restored.to_dictionary_view() == evaluation.to_dictionary_view()
+    assert json.loads(json.dumps(evaluation.to_dictionary())) == evaluation.to_dictionary()
+
+
+def test_evaluation_to_dictionary_omits_only_unset_fields():
+    evaluation = Evaluation(
+        evaluation_id="eval1",
+        run_id="run1",
+        inputs_id="inputs1",
+        inputs={},
+        outputs={},
+        targets={},
+        assessments=[],
+        metrics=[],
+        tags=[],
+    )
+    assert evaluation.to_dictionary() == {
+        "evaluation_id": "eval1",
+        "run_id": "run1",
+        "inputs_id": "inputs1",
+        "inputs": {},
+        "outputs": {},
+        "targets": {},
+    }
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+_Point = namedtuple("_Point", ["x", "y"])
+
+
+def test_evaluation_to_json_bytes():
+    timestamp = datetime(2024, 1, 1, 12, 30)
+    evaluation = Evaluation(
+        evaluation_id="eval1",
+        run_id="run1",
+        inputs_id="inputs1",
+        inputs={"question": "¿Qué?", "timestamp": timestamp},
+        outputs={"nan": float("nan"), "color": _Color.RED, "point": _Point(1, 2)},
+        metrics=[Metric(key="metric1", value=1.1, timestamp=123, step=0)],
+    )
+    evaluation_json = evaluation.to_json_bytes()
+
+    assert isinstance(evaluation_json, bytes)
+    assert evaluation_json == json.dumps(
+        evaluation.to_dictionary(),
+        cls=TraceJSONEncoder,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    assert "¿Qué?".encode() in evaluation_json
+    evaluation_json = json.loads(evaluation_json)
+    assert math.isnan(evaluation_json["outputs"].pop("nan"))
+    assert evaluation_json == {
+        "evaluation_id": "eval1",
+        "run_id": "run1",
+        "inputs_id": "inputs1",
+        "inputs": {"question": "¿Qué?", "timestamp": str(timestamp)},
+        "outputs": {"color": str(_Color.RED), "point": [1, 2]},
+        "metrics": [{"key": "metric1", "value": 1.1, "timestamp": 123, "step": 0}],
+    }
+
+
+def test_evaluation_from_dictionaries():
+    source = AssessmentSource(source_type="HUMAN", source_id="user_1")
+    evaluations = [
+        Evaluation(
+            evaluation_id="eval1",
+            run_id="run1",
+            inputs_id="inputs1",
+            inputs={"feature1": 1.0},
+            assessments=[
+                Assessment(
+                    evaluation_id="eval1",
+                    name="relevance",
+                    source=source,
+                    timestamp=123456789,
+                    numeric_value=0.9,
+                )
+            ],
+            metrics=[Metric(key="metric1", value=1.1, timestamp=123, step=0)],
+            tags=[EvaluationTag(key="tag1", value="value1")],
+        ),
+        Evaluation(
+            evaluation_id="eval2",
+            run_id="run1",
+            inputs_id="inputs2",
+            inputs={"feature1": 2.0},
+        ),
+    ]
+
+    recreated_evaluations = Evaluation.from_dictionaries([e.to_dictionary() for e in evaluations])
+    assert recreated_evaluations == evaluations
+    assert Evaluation.from_dictionaries([]) == []
+
+
+def test_evaluation_to_from_tuple():
+    source = AssessmentSource(source_type="HUMAN", source_id="user_1")
+    metric = Metric(key="metric1", value=1.1, timestamp=123, step=0)
+    tag = EvaluationTag(key="tag1", value="value1")
+    assessment = Assessment(
+        evaluation_id="eval1",
+        name="relevance",
+        source=source,
+        timestamp=123456789,
+        numeric_value=0.9,
+    )
+    evaluation = Evaluation(
+        evaluation_id="eval1",
+        run_id="run1",
+        inputs_id="inputs1",
+        inputs={"feature1": 1.0, "feature2": 2.0},
+        outputs={"prediction": 0.5},
+        request_id="req1",
+        targets={"actual": 0.6},
+        assessments=[assessment],
+        metrics=[metric],
+        tags=[tag],
+        error_code="E001",
+        error_message="An error occurred",
+    )
+
+    evaluation_tuple = evaluation.to_tuple()
+    assert evaluation_tuple == (
+        "eval1",
+        "run1",
+        "inputs1",
+        {"feature1": 1.0, "feature2": 2.0},
+        {"prediction": 0.5},
+        "req1",
+        {"actual": 0.6},
+        "E001",
+        "An error occurred",
+        [assessment.to_dictionary()],
+        [metric.to_dictionary()],
+        [tag.to_dictionary()],
+    )
+    assert len(evaluation_tuple) == len(Evaluation._FIELDS)
+    assert Evaluation.from_tuple(evaluation_tuple) == evaluation
+
+    minimal_evaluation = Evaluation(
+        evaluation_id="eval1", run_id="run1", inputs_id="inputs1", inputs={}
+    )
+    assert minimal_evaluation.to_tuple()[4:] == (None,) * 8
+    assert Evaluation.from_tuple(minimal_evaluation.to_tuple()) == minimal_evaluation
+
+
+def test_evaluation_from_tuple_with_wrong_number_of_fields():
+    with pytest.raises(MlflowException, match="Expected an evaluation tuple with 12 fields"):
+        Evaluation.from_tuple(("eval1", "run1", "inputs1"))
+
+
+def test_evaluation_interns_shared_ids():
+    evaluations = Evaluation.from_dictionaries(
+        [
+            {
+                "evaluation_id": f"eval{i}",
+                # Build the IDs at runtime so that they are distinct str objects
+                "run_id": "".join(["run", "1"]),
+                "inputs_id": "".join(["inputs", "1"]),
+                "inputs": {},
+            }
+            for i in range(2)
+        ]
+    )
+    assert evaluations[0].run_id is evaluations[1].run_id
+    assert evaluations[0].inputs_id is evaluations[1].inputs_id
+
+
+def test_evaluation_to_columnar():
+    evaluations = [
+        Evaluation(
+            evaluation_id="eval1",
+            run_id="run1",
+            inputs_id="inputs1",
+            inputs={"feature1": 1.0},
+            outputs={"prediction": 0.5},
+            metrics=[Metric(key="metric1", value=1.1, timestamp=123, step=0)],
+        ),
+        Evaluation(
+            evaluation_id="eval2",
+            run_id="run1",
+            inputs_id="inputs2",
+            inputs={"feature1": 2.0},
+            request_id="req2",
+            error_code="E001",
+        ),
+    ]
+    assert Evaluation.to_columnar(evaluations) == {
+        "evaluation_id": ["eval1", "eval2"],
+        "run_id": ["run1", "run1"],
+        "inputs_id": ["inputs1", "inputs2"],
+        "inputs": [{"feature1": 1.0}, {"feature1": 2.0}],
+        "outputs": [{"prediction": 0.5}, None],
+        "request_id": [None, "req2"],
+        "targets": [None, None],
+        "error_code": [None, "E001"],
+        "error_message": [None, None],
+    }
+    assert Evaluation.to_columnar([]) == {
+        "evaluation_id": [],
+        "run_id": [],
+        "inputs_id": [],
+        "inputs": [],
+        "outputs": [],
+        "request_id": [],
+        "targets": [],
+        "error_code": [],
+        "error_message": [],
+    }
@@ -108,6 +108,44 @@ def test_create_non_live_span():
         span.set_inputs({"input": 1})
 
 
+def test_span_ids_are_cached_per_span():
+    tracer = _get_tracer("test")
+    with tracer.start_as_current_span("parent") as parent_otel_span:
+        parent_live_span = create_mlflow_span(parent_otel_span, request_id="tr-1")
+        with tracer.start_as_current_span("child") as child_otel_span:
+            child_live_span = create_mlflow_span(child_otel_span, request_id="tr-2")
+
+    parent_span = parent_live_span.to_immutable_span()
+    child_span = child_live_span.to_immutable_span()
+    for span in [parent_span, child_span, parent_span]:
+        assert span.span_id is span.span_id
+        assert span._trace_id is span._trace_id
+        assert span.parent_id is span.parent_id
+
+    assert parent_span.request_id == "tr-1"
+    assert child_span.request_id == "tr-2"
+    assert child_span.parent_id == parent_span.span_id
+
+
+def test_live_span_ids_reflect_context_changes():
+    tracer = _get_tracer("test")
+    with tracer.start_as_current_span("span") as otel_span:
+        span = create_mlflow_span(otel_span, request_id="tr-1")
+        assert isinstance(span, LiveSpan)
+        span_id = span.span_id
+        trace_id = span._trace_id
+
+        context = otel_span.get_span_context()
+        otel_span._context = trace_api.SpanContext(
+            trace_id=context.trace_id + 1,
+            span_id=context.span_id + 1,
+            is_remote=context.is_remote,
+        )
+
+        assert span.span_id == encode_span_id(context.span_id + 1) != span_id
+        assert span._trace_id == encode_trace_id(context.trace_id + 1) != trace_id
+
+
 def test_create_noop_span():
     request_id = "tr-12345"
 
@@ -1,5 +1,8 @@
+import gc
 import importlib
 import json
+import weakref
+from dataclasses import dataclass
 from datetime import datetime
 
 import pytest
@@ -49,10 +52,8 @@ def test_json_deserialization(monkeypatch):
     model.predict(2, 5)
 
     trace = mlflow.get_last_active_trace()
-    trace_json = trace.to_json()
-
-    trace_json_as_dict = json.loads(trace_json)
-    assert trace_json_as_dict == {
+    trace_dict = trace.to_dict()
+    assert trace_dict == {
         "info": {
             "request_id": trace.info.request_id,
             "experiment_id": "0",
@@ -122,6 +123,10 @@ def test_json_deserialization(monkeypatch):
         },
     }
 
+    # The JSON representation is a serialization of the dictionary representation, so a single
+    # round trip is enough to check it
+    assert json.loads(trace.to_json()) == trace_dict
+
 
 @pytest.mark.skipif(
     importlib.util.find_spec("pydantic") is None, reason="Pydantic is not installed"
@@ -139,6 +144,41 @@ def test_trace_serialize_pydantic_model():
     assert json.loads(data_json) == {"x": 1, "y": "foo"}
 
 
+def test_trace_serialize_dataclass_and_unknown_types():
+    @dataclass
+    class MyDataclass:
+        x: int
+        y: str
+
+    class MyObject:
+        def __str__(self):
+            return "my_object"
+
+    data = {"dataclass": MyDataclass(x=1, y="foo"), "objects": [MyObject(), MyObject()]}
+    data_json = json.dumps(data, cls=TraceJSONEncoder)
+    assert json.loads(data_json) == {
+        "dataclass": {"x": 1, "y": "foo"},
+        "objects": ["my_object", "my_object"],
+    }
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("pydantic") is None, reason="Pydantic is not installed"
+)
+def test_trace_json_encoder_does_not_keep_serialized_types_alive():
+    from pydantic import BaseModel
+
+    class MyModel(BaseModel):
+        x: int
+
+    assert json.dumps(MyModel(x=1), cls=TraceJSONEncoder) == '{"x": 1}'
+
+    model_type_ref = weakref.ref(MyModel)
+    del MyModel
+    gc.collect()
+    assert model_type_ref() is None
+
+
 def _is_langchain_v0_1():
     try:
         import langchain
@@ -257,3 +257,27 @@ def test_evaluations_to_dataframes_different_tags():
     assert tags_df["evaluation_id"].iloc[1] == "eval1"
     assert tags_df["key"].iloc[1] == "tag2"
     assert tags_df["value"].iloc[1] == "value2"
+
+
+def test_evaluations_to_dataframes_does_not_modify_evaluation_dictionary():
+    evaluation = Evaluation(
+        evaluation_id="eval1",
+        run_id="run1",
+        inputs_id="inputs1",
+        inputs={"feature1": 1.0},
+        metrics=[Metric(key="metric1", value=0.9, timestamp=1234567890, step=0)],
+        tags=[EvaluationTag(key="tag1", value="value1")],
+    )
+    expected_dict = {
+        "evaluation_id": "eval1",
+        "run_id": "run1",
+        "inputs_id": "inputs1",
+        "inputs": {"feature1": 1.0},
+        "metrics": [{"key": "metric1", "value": 0.9, "timestamp": 1234567890, "step": 0}],
+        "tags": [{"key": "tag1", "value": "value1"}],
+    }
+    assert evaluation.to_dictionary() == expected_dict
+
+    evaluations_to_dataframes([evaluation])
+
+    assert evaluation.to_dictionary() == expected_dict
@@ -184,8 +184,8 @@ def _dataframes_to_evaluations(
     tags_by_eval = _group_dataframe_by_evaluation_id(tags_df)
 
     # Convert main DataFrame to list of dictionaries and create Evaluation objects
-    evaluations = []
-    for eval_dict in evaluations_df.to_dict(orient="records"):
+    eval_dicts = evaluations_df.to_dict(orient="records")
+    for eval_dict in eval_dicts:
         evaluation_id = eval_dict["evaluation_id"]
         eval_dict["metrics"] = [
             {
@@ -204,9 +204,8 @@ def _dataframes_to_evaluations(
         ]
         eval_dict["assessments"] = assessments_by_eval.get(evaluation_id, [])
         eval_dict["tags"] = tags_by_eval.get(evaluation_id, [])
-        evaluations.append(EvaluationEntity.from_dictionary(eval_dict))
 
-    return evaluations
+    return EvaluationEntity.from_dictionaries(eval_dicts)
 
 
 def _group_dataframe_by_evaluation_id(df: pd.DataFrame):
@@ -1309,7 +1309,7 @@ def test_add_trace_no_current_active_trace():
     assert parent_span.start_time_ns == rs.start_time_ns
     assert parent_span.end_time_ns == rs.end_time_ns
     assert child_span.name == rs.name
-    assert child_span.parent_id is parent_span.span_id
+    assert child_span.parent_id == parent_span.span_id
     assert child_span.start_time_ns == rs.start_time_ns
     assert child_span.end_time_ns == rs.end_time_ns
     assert child_span.status == rs.status
@@ -1333,7 +1333,7 @@ def test_add_trace_specific_target_span():
     assert parent_span.span_id == span.span_id
     rs = Trace.from_dict(_SAMPLE_REMOTE_TRACE).data.spans[0]
     assert child_span.name == rs.name
-    assert child_span.parent_id is parent_span.span_id
+    assert child_span.parent_id == parent_span.span_id
     assert grandchild_span.parent_id == child_span.span_id
 
 